@@ -0,0 +1,61 @@
+"""Compare two bench/run.py result files.
+
+    python bench/compare.py before.json after.json --fail-over 10
+
+Prints per-endpoint latency percentiles and throughput side by side with
+the relative change. With --fail-over the exit status is 1 when any p95 or
+p99 got worse by more than that percentage, so it can gate a CI job.
+"""
+import json
+
+import click
+
+LATENCY_FIELDS = ('p50_ms', 'p95_ms', 'p99_ms')
+
+def change(before, after):
+    if before in (None, 0) or after is None:
+        return None
+    return (after - before) / before * 100
+
+def format_change(percent):
+    return '     n/a' if percent is None else f"{percent:+7.1f}%"
+
+@click.command()
+@click.argument('baseline', type=click.File())
+@click.argument('candidate', type=click.File())
+@click.option('--fail-over', type=float, help='Exit 1 if any p95/p99 regresses by more than this percentage')
+def compare(baseline, candidate, fail_over):
+    """Show how CANDIDATE differs from BASELINE"""
+    before = json.load(baseline)
+    after = json.load(candidate)
+    
+    click.echo(f"baseline:  {before.get('label') or '-'} ({before.get('git_commit')})")
+    click.echo(f"candidate: {after.get('label') or '-'} ({after.get('git_commit')})")
+    if before.get('seeded_submissions') != after.get('seeded_submissions'):
+        click.echo('⚠️  the runs used different seed sizes; numbers are not directly comparable')
+    
+    regressions = []
+    rows = [('overall', before['overall'], after['overall'])] + [
+        (kind, before['endpoints'].get(kind), after['endpoints'].get(kind))
+        for kind in sorted(set(before['endpoints']) | set(after['endpoints']))
+    ]
+    click.echo(f"\n{'endpoint':12} {'metric':14} {'baseline':>10} {'candidate':>10} {'change':>9}")
+    for kind, old, new in rows:
+        if not old or not new:
+            click.echo(f"{kind:12} only in {'candidate' if new else 'baseline'}")
+            continue
+        for field in LATENCY_FIELDS + ('throughput_rps', 'errors'):
+            percent = change(old[field], new[field])
+            click.echo(f"{kind:12} {field:14} {old[field]!s:>10} {new[field]!s:>10} {format_change(percent)}")
+            if fail_over is not None and field in ('p95_ms', 'p99_ms') and percent is not None and percent > fail_over:
+                regressions.append(f"{kind} {field} {percent:+.1f}%")
+    
+    rss_change = change(before.get('peak_rss_mb'), after.get('peak_rss_mb'))
+    click.echo(f"\npeak RSS MB: {before.get('peak_rss_mb')} -> {after.get('peak_rss_mb')} {format_change(rss_change)}")
+    
+    if regressions:
+        click.echo(f"\n❌ Regressions over {fail_over}%: {', '.join(regressions)}")
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    compare()
@@ -0,0 +1,94 @@
+"""Time the dashboard headline numbers as the submission table grows.
+
+Run from the repository root against a scratch database; rows are added
+to it with bulk inserts:
+
+    DATABASE_URL=sqlite:////tmp/dashboard.db python bench/dashboard.py --sizes 1000,10000,100000,400000
+
+At each size it times GET /admin/dashboard-stats end to end and the
+aggregated query behind it (dashboard_aggregates) on its own, so the
+remainder is the recent-submissions lookup and serialization.
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import Submission, SubmissionPhoto, app, dashboard_aggregates, db, init_database  # noqa: E402
+
+MATERIALS = ['metal', 'electronics', 'paper', 'plastic', 'automotive', 'construction']
+
+def grow(rng, count, chunk_size):
+    """Bulk insert ``count`` submissions with zero to three photos each"""
+    now = datetime.utcnow()
+    added = 0
+    while added < count:
+        batch = min(chunk_size, count - added)
+        rows = []
+        for _ in range(batch):
+            created_at = now - timedelta(seconds=rng.randint(0, 365 * 86400))
+            rows.append({
+                'material_type': rng.choice(MATERIALS),
+                'title': 'Bench listing',
+                'description': 'bulk inserted',
+                'submission_date': created_at.strftime('%Y-%m-%d %H:%M:%S'),
+                'created_at': created_at,
+            })
+        ids = db.session.execute(db.insert(Submission).returning(Submission.id), rows).scalars().all()
+        photos = [
+            {'submission_id': submission_id, 'position': position, 'filename': f"bench/{submission_id}-{position}.jpg"}
+            for submission_id in ids
+            for position in range(rng.randint(0, 3))
+        ]
+        if photos:
+            db.session.execute(db.insert(SubmissionPhoto), photos)
+        db.session.commit()
+        added += batch
+
+def median_ms(action, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+@click.command()
+@click.option('--sizes', default='1000,10000,100000,400000', show_default=True, help='Table sizes to measure at')
+@click.option('--repeat', default=20, show_default=True, help='Timed runs per size; the median is reported')
+@click.option('--chunk-size', default=5000, show_default=True, help='Rows per insert transaction')
+@click.option('--seed', default=1, show_default=True)
+def benchmark(sizes, repeat, chunk_size, seed):
+    """Time the dashboard endpoint and its aggregated query"""
+    rng = random.Random(seed)
+    client = app.test_client()
+    
+    with app.app_context():
+        init_database()
+        rows = db.session.query(Submission).count()
+    
+    click.echo(f"{'rows':>8} {'endpoint ms':>12} {'query ms':>9}")
+    for size in sorted(int(size) for size in sizes.split(',')):
+        with app.app_context():
+            if size > rows:
+                grow(rng, size - rows, chunk_size)
+                rows = size
+            query_ms = median_ms(dashboard_aggregates, repeat)
+            db.session.rollback()
+        
+        def load_dashboard():
+            response = client.get('/admin/dashboard-stats')
+            if not response.json['success']:
+                raise click.ClickException(response.json['message'])
+        
+        endpoint_ms = median_ms(load_dashboard, repeat)
+        click.echo(f"{rows:>8} {endpoint_ms:12.2f} {query_ms:9.2f}")
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,86 @@
+"""Measure what logging costs the request thread.
+
+    DATABASE_URL=sqlite:////tmp/bench.db python bench/log_overhead.py
+
+First the per-call cost of a log line on the calling thread: through the
+app's queue handler, with the level disabled, and through a plain
+synchronous StreamHandler for comparison. Then the end-to-end latency of
+a photo-less POST /submit_listing (which logs one line) with LOG_LEVEL at
+INFO and at WARNING. Log output goes to /dev/null for the run.
+"""
+import logging
+import os
+import statistics
+import sys
+import time
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import JsonLogFormatter, _log_listener, app, init_database, logger  # noqa: E402
+
+FORM = {
+    'materialType': 'metal',
+    'listingTitle': 'Log bench',
+    'listingDescription': 'measuring logging overhead',
+    'listingQuantity': '1 kg',
+    'sellerName': 'Bench',
+    'listingLocation': 'Pune',
+    'listingContact': '9000000000',
+    'sellerEmail': 'bench@example.com',
+}
+
+def per_call_ns(log, calls):
+    started = time.perf_counter_ns()
+    for index in range(calls):
+        log.info("Listing stored", extra={'fields': {'submission_id': index, 'photos': 2}})
+    return (time.perf_counter_ns() - started) / calls
+
+def request_ms(client, requests):
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = client.post('/submit_listing', data=FORM)
+        timings.append(time.perf_counter() - started)
+        if not response.json['success']:
+            raise click.ClickException(response.json['message'])
+    timings.sort()
+    return statistics.median(timings) * 1000, timings[int(len(timings) * 0.99) - 1] * 1000
+
+@click.command()
+@click.option('--calls', default=100000, show_default=True, help='Log calls per per-call measurement')
+@click.option('--requests', default=500, show_default=True, help='Requests per end-to-end measurement')
+def benchmark(calls, requests):
+    """Compare logging enabled, disabled and synchronous"""
+    devnull = open(os.devnull, 'w')
+    for handler in _log_listener.handlers:
+        handler.setStream(devnull)
+    
+    click.echo(f"{'per log call':28} {'ns':>10}")
+    logger.setLevel(logging.INFO)
+    click.echo(f"{'queue handler, INFO':28} {per_call_ns(logger, calls):10.0f}")
+    logger.setLevel(logging.WARNING)
+    click.echo(f"{'queue handler, disabled':28} {per_call_ns(logger, calls):10.0f}")
+    
+    direct = logging.getLogger('log-overhead-direct')
+    direct.propagate = False
+    stream_handler = logging.StreamHandler(devnull)
+    stream_handler.setFormatter(JsonLogFormatter())
+    direct.addHandler(stream_handler)
+    direct.setLevel(logging.INFO)
+    click.echo(f"{'synchronous StreamHandler':28} {per_call_ns(direct, calls):10.0f}")
+    
+    with app.app_context():
+        init_database()
+    client = app.test_client()
+    request_ms(client, 20)  # warm up
+    
+    click.echo(f"\n{'POST /submit_listing':28} {'p50 ms':>10} {'p99 ms':>10}")
+    for level in (logging.INFO, logging.WARNING):
+        logger.setLevel(level)
+        p50, p99 = request_ms(client, requests)
+        click.echo(f"{'LOG_LEVEL=' + logging.getLevelName(level):28} {p50:10.3f} {p99:10.3f}")
+
+if __name__ == '__main__':
+    benchmark()
@@ -0,0 +1,165 @@
+"""Exercise the database connection pool against a stand-in database.
+
+Point DATABASE_URL at a local Postgres (or a SQLite file) and run from the
+repository root; the DB_* settings are read the same way the app reads them:
+
+    DATABASE_URL=postgresql://localhost/scrapy5_test DB_POOL_SIZE=3 DB_MAX_OVERFLOW=2 python bench/pool.py
+    DATABASE_URL=sqlite:////tmp/pool.db python bench/pool.py --threads 30
+
+Three checks, each printing ✅ or ❌ (the exit status is 1 if any fails):
+
+- burst: more threads than pool_size + max_overflow each hold a connection
+  for a while; nothing may time out, occupancy must stay within the limit,
+  and the checkout-wait histogram shows how long threads queued.
+- stale: the pooled connections are closed underneath the pool, as a
+  pooler does to idle clients; with DB_POOL_PRE_PING the next queries must
+  still succeed.
+- fork: a forked child calls dispose_inherited_engine() and must open its
+  own connection, while the parent's pooled connections keep working.
+"""
+import os
+import sys
+import threading
+import time
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app, db, dispose_inherited_engine, pool_checkout_wait, pool_events  # noqa: E402
+
+def query(hold=0.0):
+    with app.app_context():
+        with db.engine.connect() as connection:
+            connection.execute(db.text('SELECT 1'))
+            time.sleep(hold)
+
+def checkout_waits():
+    """``(checkouts, seconds waited)`` so far, from the pool's histogram"""
+    values = {name: value for name, _, value in pool_checkout_wait.samples()}
+    return values.get(f'{pool_checkout_wait.name}_count', 0), values.get(f'{pool_checkout_wait.name}_sum', 0.0)
+
+def check_burst(threads, hold):
+    pool = db.engine.pool
+    limit = app.config['DB_POOL_SIZE'] + app.config['DB_MAX_OVERFLOW']
+    errors = []
+    peak = [0]
+    
+    def client():
+        try:
+            query(hold)
+        except Exception as e:
+            errors.append(e)
+    
+    waits_before = checkout_waits()
+    workers = [threading.Thread(target=client) for _ in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    while any(worker.is_alive() for worker in workers):
+        peak[0] = max(peak[0], pool.checkedout())
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - started
+    
+    checkouts, waited = checkout_waits()
+    mean_wait_ms = (waited - waits_before[1]) / max(checkouts - waits_before[0], 1) * 1000
+    click.echo(
+        f"   {threads} threads holding {hold}s each: {elapsed:.2f}s total, "
+        f"peak {peak[0]}/{limit} checked out, mean checkout wait {mean_wait_ms:.1f} ms"
+    )
+    for error in errors[:3]:
+        click.echo(f"   {type(error).__name__}: {error}")
+    return not errors and peak[0] <= limit
+
+def check_stale():
+    pool = db.engine.pool
+    size = app.config['DB_POOL_SIZE']
+    
+    # Fill the pool, then close every idle connection behind its back
+    connections = [db.engine.connect() for _ in range(size)]
+    raw_connections = []
+    for connection in connections:
+        connection.execute(db.text('SELECT 1'))
+        raw_connections.append(connection.connection.dbapi_connection)
+    for connection in connections:
+        connection.close()
+    for raw_connection in raw_connections:
+        raw_connection.close()
+    
+    invalidations_before = pool_events['invalidations']
+    try:
+        for _ in range(size):
+            query()
+    except Exception as e:
+        click.echo(f"   query after the connections were dropped failed: {type(e).__name__}: {e}")
+        return False
+    click.echo(
+        f"   pre_ping={app.config['DB_POOL_PRE_PING']}: {size} dropped connections, "
+        f"{pool_events['invalidations'] - invalidations_before} invalidation(s), then {pool.status()}"
+    )
+    return True
+
+def check_fork():
+    if not hasattr(os, 'fork'):
+        click.echo('   os.fork is not available here')
+        return True
+    
+    query()  # make sure the parent holds a pooled connection
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        status = b'1'
+        try:
+            dispose_inherited_engine()
+            query()
+            if pool_events['connects'] != 1:
+                status = b'0'
+        except Exception:
+            status = b'0'
+        os.write(write_end, status)
+        os._exit(0)
+    
+    os.close(write_end)
+    child_ok = os.read(read_end, 1) == b'1'
+    os.close(read_end)
+    os.waitpid(pid, 0)
+    
+    try:
+        query()
+        parent_ok = True
+    except Exception as e:
+        click.echo(f"   parent query after the child exited failed: {type(e).__name__}: {e}")
+        parent_ok = False
+    click.echo(f"   child opened its own connection: {child_ok}; parent still connected: {parent_ok}")
+    return child_ok and parent_ok
+
+@click.command()
+@click.option('--threads', default=20, show_default=True, help='Concurrent clients in the burst check')
+@click.option('--hold', default=0.2, show_default=True, help='Seconds each burst client keeps its connection')
+def harness(threads, hold):
+    """Run the burst, stale and fork checks against DATABASE_URL"""
+    failed = []
+    with app.app_context():
+        click.echo(
+            f"{db.engine.url.render_as_string(hide_password=True)}: {type(db.engine.pool).__name__}, "
+            f"size {app.config['DB_POOL_SIZE']}, overflow {app.config['DB_MAX_OVERFLOW']}, "
+            f"timeout {app.config['DB_POOL_TIMEOUT']}s"
+        )
+        for name, check in (
+            ('burst', lambda: check_burst(threads, hold)),
+            ('stale', check_stale),
+            ('fork', check_fork),
+        ):
+            click.echo(f"{name}:")
+            if check():
+                click.echo(f"✅ {name}")
+            else:
+                click.echo(f"❌ {name}")
+                failed.append(name)
+    
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    harness()
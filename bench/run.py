@@ -0,0 +1,448 @@
+"""Drive a mixed HTTP workload against a running app and record the results.
+
+Seed first (bench/seed.py), start the app, then for example:
+
+    python bench/run.py --base-url http://127.0.0.1:8000 --concurrency 16 \
+        --duration 60 --server-pid $(pgrep -o gunicorn) --output before.json
+
+or let the runner start and stop the server itself:
+
+    python bench/run.py --start-server "gunicorn -c gunicorn.conf.py app:app" \
+        --base-url http://127.0.0.1:8000 --output after.json
+
+The request mix, its random choices and the multipart bodies all derive
+from --seed. Results are written as JSON (per-endpoint p50/p95/p99,
+throughput, errors and the server's peak RSS) for bench/compare.py.
+
+With --client-cache each client keeps an HTTP cache like a browser and
+revalidates with If-None-Match, so 304s show up in the statuses and
+requests a cache would have answered are counted as cache hits.
+"""
+import http.client
+import json
+import os
+import platform
+import random
+import shlex
+import signal
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from urllib.parse import quote, urlsplit
+
+import click
+
+DEFAULT_MIX = 'submit=5,list=15,search=10,deep_page=5,cursor_page=5,dashboard=10,prices=20,upload=20,thumb=10'
+
+def parse_mix(mix):
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        weights[name.strip()] = float(weight or 1)
+    unknown = set(weights) - set(REQUEST_BUILDERS)
+    if unknown:
+        raise click.BadParameter(f"unknown request kinds: {', '.join(sorted(unknown))}", param_hint='--mix')
+    return weights
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+# ========== REQUESTS ==========
+
+def multipart_body(rng, fields, files):
+    boundary = f"bench{rng.getrandbits(64):016x}"
+    parts = []
+    for name, value in fields.items():
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode()
+        )
+    for name, filename, data in files:
+        parts.append(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f'Content-Type: image/jpeg\r\n\r\n'.encode() + data + b'\r\n'
+        )
+    parts.append(f'--{boundary}--\r\n'.encode())
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+def build_submit(rng, manifest):
+    files = [
+        ('fileInput', f'photo{index}.jpg', manifest['sample_bytes'][index % len(manifest['sample_bytes'])])
+        for index in range(rng.randint(0, 3))
+    ] if manifest['sample_bytes'] else []
+    body, content_type = multipart_body(rng, {
+        'materialType': rng.choice(manifest['materials']),
+        'listingTitle': f"Bench listing {rng.randint(1, 10 ** 6)}",
+        'listingDescription': 'Synthetic listing created by bench/run.py',
+        'listingQuantity': f"{rng.randint(1, 500)} kg",
+        'sellerName': 'Bench',
+        'listingLocation': 'Pune',
+        'listingContact': '9000000000',
+        'sellerEmail': 'bench@example.com',
+    }, files)
+    return 'POST', '/submit_listing', body, {'Content-Type': content_type}
+
+def build_list(rng, manifest):
+    material = rng.choice(manifest['materials'] + [''])
+    return 'GET', f"/admin/submissions?limit=50&material={material}", None, {}
+
+def build_search(rng, manifest):
+    term = quote(rng.choice(manifest['search_terms']))
+    return 'GET', f"/admin/submissions?limit=50&search={term}", None, {}
+
+def build_deep_page(rng, manifest):
+    offset = rng.randint(0, max(manifest['submissions'] - 50, 0))
+    return 'GET', f"/admin/submissions?limit=50&offset={offset}&count=estimate", None, {}
+
+def build_cursor_page(rng, manifest):
+    cursor = rng.randint(1, max(manifest['max_submission_id'], 1))
+    return 'GET', f"/admin/submissions?limit=50&cursor={cursor}&count=none", None, {}
+
+def build_dashboard(rng, manifest):
+    return 'GET', '/admin/dashboard-stats', None, {}
+
+def build_prices(rng, manifest):
+    return 'GET', '/admin/prices', None, {}
+
+def build_upload(rng, manifest):
+    return 'GET', f"/uploads/{rng.choice(manifest['photos'])}", None, {}
+
+def build_thumb(rng, manifest):
+    rendition = rng.choice(manifest['renditions'] or ['thumb'])
+    return 'GET', f"/uploads/{rendition}/{rng.choice(manifest['photos'])}{manifest['rendition_extension']}", None, {}
+
+REQUEST_BUILDERS = {
+    'submit': build_submit,
+    'list': build_list,
+    'search': build_search,
+    'deep_page': build_deep_page,
+    'cursor_page': build_cursor_page,
+    'dashboard': build_dashboard,
+    'prices': build_prices,
+    'upload': build_upload,
+    'thumb': build_thumb,
+}
+
+# ========== SERVER ==========
+
+def process_tree(root_pid):
+    """The root pid and all its descendants, read from /proc"""
+    children = defaultdict(list)
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as stat_file:
+                parent = int(stat_file.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children[parent].append(int(entry))
+    pids = [root_pid]
+    for pid in pids:
+        pids.extend(children.get(pid, []))
+    return pids
+
+def tree_rss_kb(root_pid):
+    total = 0
+    for pid in process_tree(root_pid):
+        try:
+            with open(f'/proc/{pid}/status') as status_file:
+                for line in status_file:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total
+
+class RssSampler(threading.Thread):
+    """Samples the summed RSS of a server process tree and keeps the peak"""
+    
+    def __init__(self, pid, interval=0.2):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak_kb = 0
+        self.stopped = threading.Event()
+    
+    def run(self):
+        while not self.stopped.is_set():
+            self.peak_kb = max(self.peak_kb, tree_rss_kb(self.pid))
+            self.stopped.wait(self.interval)
+
+def wait_for_server(base_url, timeout):
+    parts = urlsplit(base_url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=2)
+            connection.request('GET', '/ping')
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise click.ClickException(f'Server at {base_url} did not answer /ping within {timeout}s')
+
+# ========== WORKLOAD ==========
+
+class Worker(threading.Thread):
+    """One client with a keep-alive connection issuing weighted random requests"""
+    
+    def __init__(self, index, args, manifest, weights, deadline, results):
+        super().__init__(daemon=True)
+        self.rng = random.Random(f"{args['seed']}-{index}")
+        self.args = args
+        self.manifest = manifest
+        self.kinds = list(weights)
+        self.weights = list(weights.values())
+        self.deadline = deadline
+        self.results = results
+        self.connection = None
+        self.cache = {}  # path -> (etag, fresh until, immutable) for --client-cache
+    
+    def connect(self):
+        parts = urlsplit(self.args['base_url'])
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=self.args['timeout'])
+    
+    def send(self, method, path, body, headers):
+        headers = {'Accept-Encoding': 'gzip', **headers}
+        rate = self.args['slow_upload_bps']
+        if body is not None and rate:
+            # A slow client: headers first, then the body trickled out in small chunks
+            self.connection.putrequest(method, path)
+            for name, value in {**headers, 'Content-Length': str(len(body))}.items():
+                self.connection.putheader(name, value)
+            self.connection.endheaders()
+            chunk = max(rate // 10, 1)
+            for start in range(0, len(body), chunk):
+                self.connection.send(body[start:start + chunk])
+                time.sleep(0.1)
+        else:
+            self.connection.request(method, path, body=body, headers=headers)
+        response = self.connection.getresponse()
+        payload = response.read()
+        return response.status, len(payload), response
+    
+    def cached_request(self, method, path, headers):
+        """Apply --client-cache to a request.
+
+        Returns ``None`` when a browser would answer from its cache without
+        asking the server, else the headers to send. ``fresh`` reuses
+        entries until max-age runs out; ``reload`` revalidates everything
+        that is not immutable, like a page reload.
+        """
+        mode = self.args['client_cache']
+        entry = self.cache.get(path) if method == 'GET' and mode != 'off' else None
+        if entry is None:
+            return headers
+        etag, fresh_until, immutable = entry
+        if immutable or (mode == 'fresh' and time.monotonic() < fresh_until):
+            return None
+        return {**headers, 'If-None-Match': etag} if etag else headers
+    
+    def remember(self, method, path, status, response):
+        if method != 'GET' or self.args['client_cache'] == 'off' or status not in (200, 304):
+            return
+        cache_control = response.getheader('Cache-Control') or ''
+        directives = {part.strip().partition('=')[0]: part.strip().partition('=')[2] for part in cache_control.split(',')}
+        if 'no-store' in directives:
+            return
+        max_age = int(directives.get('max-age') or 0)
+        previous = self.cache.get(path)
+        etag = response.getheader('ETag') or (previous[0] if previous else None)
+        self.cache[path] = (etag, time.monotonic() + max_age, 'immutable' in directives)
+    
+    def run(self):
+        self.connect()
+        while time.monotonic() < self.deadline() and not self.results.full():
+            kind = self.rng.choices(self.kinds, self.weights)[0]
+            method, path, body, headers = REQUEST_BUILDERS[kind](self.rng, self.manifest)
+            headers = self.cached_request(method, path, headers)
+            if headers is None:
+                self.results.record_cache_hit(kind)
+                time.sleep(0.001)  # no busy loop once everything is cached
+                continue
+            started = time.perf_counter()
+            try:
+                status, size, response = self.send(method, path, body, headers)
+                error = status >= 400
+                self.remember(method, path, status, response)
+            except (OSError, http.client.HTTPException):
+                status, size, error = None, 0, True
+                self.connection.close()
+                self.connect()
+            self.results.record(kind, time.perf_counter() - started, status, size, error)
+
+class Results:
+    def __init__(self, max_requests):
+        self.lock = threading.Lock()
+        self.max_requests = max_requests
+        self.recording = False
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+        self.bytes = Counter()
+        self.statuses = defaultdict(Counter)
+        self.cache_hits = Counter()
+        self.total = 0
+    
+    def full(self):
+        return bool(self.max_requests) and self.total >= self.max_requests
+    
+    def record(self, kind, elapsed, status, size, error):
+        if not self.recording:
+            return
+        with self.lock:
+            self.total += 1
+            self.latencies[kind].append(elapsed)
+            self.bytes[kind] += size
+            self.statuses[kind][str(status)] += 1
+            if error:
+                self.errors[kind] += 1
+    
+    def record_cache_hit(self, kind):
+        if self.recording:
+            with self.lock:
+                self.cache_hits[kind] += 1
+
+def summarize(latencies, errors, size, elapsed):
+    values = sorted(latencies)
+    return {
+        'requests': len(values),
+        'errors': errors,
+        'throughput_rps': round(len(values) / elapsed, 2) if elapsed else None,
+        'bytes_per_request': round(size / len(values)) if values else None,
+        'mean_ms': round(sum(values) / len(values) * 1000, 3) if values else None,
+        'p50_ms': round(percentile(values, 0.50) * 1000, 3) if values else None,
+        'p95_ms': round(percentile(values, 0.95) * 1000, 3) if values else None,
+        'p99_ms': round(percentile(values, 0.99) * 1000, 3) if values else None,
+        'max_ms': round(values[-1] * 1000, 3) if values else None,
+    }
+
+def format_ms(value):
+    return '       -' if value is None else f"{value:8.2f}"
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+@click.command()
+@click.option('--base-url', default='http://127.0.0.1:5000', show_default=True)
+@click.option('--manifest', 'manifest_path', default=os.path.join('bench', 'manifest.json'), show_default=True)
+@click.option('--concurrency', default=8, show_default=True, help='Concurrent clients')
+@click.option('--duration', default=30.0, show_default=True, help='Measured seconds (after warm-up)')
+@click.option('--requests', 'max_requests', default=0, help='Stop after this many measured requests instead')
+@click.option('--warmup', default=5.0, show_default=True, help='Unmeasured seconds before recording')
+@click.option('--mix', default=DEFAULT_MIX, show_default=True, help='Weighted request kinds')
+@click.option('--slow-upload-bps', default=0, help='Trickle request bodies at this many bytes/s (slow clients)')
+@click.option(
+    '--client-cache', type=click.Choice(['off', 'fresh', 'reload']), default='off', show_default=True,
+    help='Keep a per-client HTTP cache and revalidate with If-None-Match'
+)
+@click.option('--timeout', default=30.0, show_default=True, help='Per-request timeout in seconds')
+@click.option('--seed', default=1, show_default=True)
+@click.option('--server-pid', type=int, help='Sample peak RSS of this process and its children')
+@click.option('--start-server', help='Command that starts the app; it is stopped after the run')
+@click.option('--label', default='', help='Free-form label stored in the results')
+@click.option('--output', type=click.Path(dir_okay=False), help='Write the JSON results here instead of stdout')
+def run(**args):
+    """Run the mixed workload and print or save JSON results"""
+    weights = parse_mix(args['mix'])
+    with open(args['manifest_path']) as manifest_file:
+        manifest = json.load(manifest_file)
+    upload_folder = os.environ.get('UPLOAD_FOLDER', 'uploads')
+    manifest['sample_bytes'] = []
+    for filename in manifest.get('upload_samples', []):
+        with open(os.path.join(upload_folder, filename), 'rb') as sample:
+            manifest['sample_bytes'].append(sample.read())
+    
+    server = None
+    server_pid = args['server_pid']
+    if args['start_server']:
+        server = subprocess.Popen(shlex.split(args['start_server']), start_new_session=True)
+        server_pid = server.pid
+    try:
+        wait_for_server(args['base_url'], timeout=60)
+        
+        sampler = None
+        if server_pid and sys.platform.startswith('linux'):
+            sampler = RssSampler(server_pid)
+            sampler.start()
+        
+        results = Results(args['max_requests'])
+        window = {'end': float('inf')}
+        workers = [
+            Worker(index, args, manifest, weights, lambda: window['end'], results)
+            for index in range(args['concurrency'])
+        ]
+        for worker in workers:
+            worker.start()
+        
+        time.sleep(args['warmup'])
+        results.recording = True
+        started = time.perf_counter()
+        window['end'] = time.monotonic() + (args['duration'] if not args['max_requests'] else float('inf'))
+        while any(worker.is_alive() for worker in workers):
+            if args['max_requests'] and results.full():
+                window['end'] = 0
+            time.sleep(0.05)
+        elapsed = time.perf_counter() - started
+        
+        if sampler is not None:
+            sampler.stopped.set()
+            sampler.join()
+    finally:
+        if server is not None:
+            os.killpg(server.pid, signal.SIGTERM)
+            server.wait(timeout=30)
+    
+    all_latencies = [value for values in results.latencies.values() for value in values]
+    report = {
+        'label': args['label'],
+        'started_at': datetime.utcnow().isoformat() + 'Z',
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {key: value for key, value in args.items() if key not in ('output',)},
+        'seeded_submissions': manifest['submissions'],
+        'elapsed_s': round(elapsed, 3),
+        'peak_rss_mb': round(sampler.peak_kb / 1024, 1) if sampler is not None else None,
+        'overall': summarize(all_latencies, sum(results.errors.values()), sum(results.bytes.values()), elapsed),
+        'endpoints': {
+            kind: {
+                **summarize(results.latencies[kind], results.errors[kind], results.bytes[kind], elapsed),
+                'statuses': dict(results.statuses[kind]),
+                'cache_hits': results.cache_hits[kind],
+            }
+            for kind in sorted(set(results.latencies) | set(results.cache_hits))
+        },
+    }
+    
+    for kind, stats in report['endpoints'].items():
+        click.echo(
+            f"{kind:12} {stats['requests']:7d} req  {stats['throughput_rps']:8.1f}/s  "
+            f"p50 {format_ms(stats['p50_ms'])}  p95 {format_ms(stats['p95_ms'])}  p99 {format_ms(stats['p99_ms'])} ms  "
+            f"{stats['errors']} errors  {stats['cache_hits']} cached",
+            err=True
+        )
+    click.echo(f"peak RSS: {report['peak_rss_mb']} MB", err=True)
+    
+    text = json.dumps(report, indent=2)
+    if args['output']:
+        with open(args['output'], 'w') as output_file:
+            output_file.write(text + '\n')
+    else:
+        click.echo(text)
+
+if __name__ == '__main__':
+    run()
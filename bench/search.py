@@ -0,0 +1,105 @@
+"""Time admin search with the trigram index against the plain ilike scan.
+
+Seed a large database first, then run against it from the repository root:
+
+    DATABASE_URL=sqlite:////tmp/bench.db python bench/seed.py --submissions 100000 --images 20 --no-renditions
+    DATABASE_URL=sqlite:////tmp/bench.db python bench/search.py
+
+Each search runs in-process, the way the listing does: an exact count and
+the newest page of results. Terms come from the manifest as whole words,
+infixes from the middle of those words, email fragments and two-letter
+strings (which fall back to the scan). Both backends must return the same
+rows for every term, otherwise the run fails.
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import Submission, app, db, filtered_submission_query, search_backend  # noqa: E402
+
+def search_terms(manifest):
+    words = [term for term in manifest['search_terms'] if len(term) >= 5]
+    return {
+        'word': manifest['search_terms'],
+        'infix': sorted({word[1:5].lower() for word in words}),
+        'email': ['seller12', 'r40@exa', '@example.com'],
+        'short': ['pe', 'ir', '9'],
+    }
+
+def run_search(term, page_size):
+    """Count the matches and fetch the first page, as the listing does"""
+    query = filtered_submission_query(term)
+    started = time.perf_counter()
+    total = query.count()
+    page = [row.id for row in query.with_entities(Submission.id).order_by(Submission.id.desc()).limit(page_size)]
+    elapsed = time.perf_counter() - started
+    db.session.rollback()
+    return elapsed, total, page
+
+def time_backend(backend, terms, repeat, page_size):
+    """Median timing and the results of every term for one backend"""
+    app.config['SUBMISSION_SEARCH_BACKEND'] = backend
+    results = {}
+    for term in terms:
+        timings = []
+        for _ in range(repeat):
+            elapsed, total, page = run_search(term, page_size)
+            timings.append(elapsed)
+        results[term] = (statistics.median(timings), total, page)
+    return search_backend(), results
+
+@click.command()
+@click.option('--manifest', 'manifest_path', default=os.path.join('bench', 'manifest.json'), show_default=True)
+@click.option('--repeat', default=5, show_default=True, help='Runs per term; the median is reported')
+@click.option('--page-size', default=50, show_default=True)
+@click.option('--output', type=click.Path(dir_okay=False), help='Also write the results as JSON')
+def benchmark(manifest_path, repeat, page_size, output):
+    """Compare search latency with and without the trigram index"""
+    with open(manifest_path) as manifest_file:
+        manifest = json.load(manifest_file)
+    
+    groups = search_terms(manifest)
+    report = {'seeded_submissions': manifest['submissions'], 'groups': {}}
+    mismatches = []
+    
+    with app.app_context():
+        rows = db.session.query(Submission).count()
+        click.echo(f"{rows} submissions, dialect {db.engine.dialect.name}")
+        click.echo(f"\n{'terms':8} {'ilike ms':>10} {'index ms':>10} {'speedup':>8}")
+        
+        for group, terms in groups.items():
+            _, scan = time_backend('ilike', terms, repeat, page_size)
+            indexed_backend, indexed = time_backend('auto', terms, repeat, page_size)
+            
+            for term in terms:
+                if scan[term][1:] != indexed[term][1:]:
+                    mismatches.append(term)
+            
+            scan_ms = statistics.median(result[0] for result in scan.values()) * 1000
+            indexed_ms = statistics.median(result[0] for result in indexed.values()) * 1000
+            report['groups'][group] = {
+                'terms': len(terms),
+                'ilike_ms': round(scan_ms, 2),
+                'index_ms': round(indexed_ms, 2),
+                'backend': indexed_backend,
+                'matches': {term: indexed[term][1] for term in terms},
+            }
+            click.echo(f"{group:8} {scan_ms:10.2f} {indexed_ms:10.2f} {scan_ms / indexed_ms:7.1f}x")
+    
+    report['rows'] = rows
+    if output:
+        with open(output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+    
+    if mismatches:
+        raise click.ClickException(f"Index and ilike disagree on: {', '.join(mismatches)}")
+    click.echo(f"\n✅ Both backends returned the same rows for all terms (index backend: {indexed_backend})")
+
+if __name__ == '__main__':
+    benchmark()
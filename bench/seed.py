@@ -0,0 +1,169 @@
+"""Seed a database and the upload folder with synthetic data for benchmarks.
+
+Run from the repository root, pointing DATABASE_URL at a scratch database:
+
+    DATABASE_URL=sqlite:////tmp/bench.db python bench/seed.py --submissions 50000
+
+Everything is derived from --seed, so two runs with the same arguments
+produce the same rows and the same image files. A manifest describing the
+seeded data (photo filenames, search terms, materials) is written for
+bench/run.py to build its requests from.
+"""
+import hashlib
+import io
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+import click
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import (  # noqa: E402
+    RENDITION_EXTENSION, Image, app, blob_filename, db, init_database, persist_submissions, price_cache,
+    process_image, upsert_prices
+)
+
+MATERIALS = ['metal', 'electronics', 'paper', 'plastic', 'automotive', 'construction']
+
+ITEMS = {
+    'metal': ['copper wire', 'aluminium cans', 'brass fittings', 'iron rods', 'steel sheets', 'radiator cores'],
+    'electronics': ['old smartphones', 'laptop boards', 'CRT monitors', 'server racks', 'power supplies', 'cables'],
+    'paper': ['cardboard boxes', 'newspapers', 'office paper', 'old books', 'magazines', 'paper cores'],
+    'plastic': ['PET bottles', 'HDPE drums', 'crates', 'film rolls', 'PVC pipes', 'containers'],
+    'automotive': ['car batteries', 'tyres', 'alloy wheels', 'engine blocks', 'catalytic converters', 'bumpers'],
+    'construction': ['rebar offcuts', 'roof tiles', 'copper pipes', 'window frames', 'scaffolding', 'girders'],
+}
+
+WORDS = (
+    'clean sorted bulk mixed heavy used scrap surplus industrial residential pickup available '
+    'weekly monthly stripped unstripped bundled loose baled dry grade condition warehouse site'
+).split()
+
+CITIES = ['Pune', 'Mumbai', 'Delhi', 'Bengaluru', 'Chennai', 'Hyderabad', 'Kolkata', 'Ahmedabad', 'Jaipur', 'Surat']
+
+PRICE_CATEGORIES = {
+    'metal': ['copper', 'brass', 'aluminium', 'iron', 'steel', 'lead', 'zinc', 'stainless'],
+    'paper': ['newspaper', 'cardboard', 'office', 'books', 'magazines'],
+    'plastic': ['pet', 'hdpe', 'ldpe', 'pp', 'pvc'],
+    'electronics': ['phones', 'laptops', 'boards', 'cables', 'batteries'],
+    'automotive': ['batteries', 'tyres', 'radiators', 'converters'],
+}
+
+# Phone photos after the browser resizes them: a few hundred KB to ~1 MB
+IMAGE_SIZES = [(1280, 960), (1600, 1200), (2048, 1536), (960, 1280)]
+
+def synthetic_image(rng, width, height):
+    """A JPEG with photo-like detail, built from seeded noise so it is reproducible"""
+    small = (max(width // 6, 1), max(height // 6, 1))
+    noise = Image.frombytes('RGB', small, rng.randbytes(small[0] * small[1] * 3))
+    image = noise.resize((width, height), Image.BICUBIC)
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=85)
+    return buffer.getvalue()
+
+def seed_images(rng, count, renditions):
+    """Write ``count`` distinct images into the blob store; returns their blob tuples"""
+    upload_folder = app.config['UPLOAD_FOLDER']
+    blobs = []
+    for _ in range(count):
+        data = synthetic_image(rng, *rng.choice(IMAGE_SIZES))
+        digest = hashlib.sha256(data).hexdigest()
+        filename = blob_filename(digest, '.jpg')
+        path = os.path.join(upload_folder, filename)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as image_file:
+                image_file.write(data)
+        if renditions:
+            process_image(filename, upload_folder, dict(app.config['IMAGE_RENDITIONS']))
+        blobs.append((digest, filename, len(data)))
+    return blobs
+
+def synthetic_payload(rng, blobs, created_at):
+    material = rng.choice(MATERIALS)
+    item = rng.choice(ITEMS[material])
+    city = rng.choice(CITIES)
+    return {
+        'material_type': material,
+        'title': f"{rng.choice(WORDS).capitalize()} {item}",
+        'description': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(8, 60))) + f" {item} in {city}",
+        'quantity': f"{rng.randint(1, 500)} kg",
+        'name': f"Seller {rng.randint(1, 5000)}",
+        'location': city,
+        'contact': f"9{rng.randint(100000000, 999999999)}",
+        'email': f"seller{rng.randint(1, 5000)}@example.com",
+        'submission_date': created_at.strftime('%Y-%m-%d %H:%M:%S'),
+        'created_at': created_at.isoformat(),
+        'photos': rng.sample(blobs, k=min(len(blobs), rng.choice([0, 1, 1, 2, 3, 4])))
+    }
+
+@click.command()
+@click.option('--submissions', default=10000, show_default=True, help='Submission rows to create')
+@click.option('--images', default=40, show_default=True, help='Distinct image files shared by the submissions')
+@click.option('--days', default=365, show_default=True, help='Spread created_at over this many past days')
+@click.option('--chunk-size', default=1000, show_default=True, help='Submissions per transaction')
+@click.option('--renditions/--no-renditions', default=True, show_default=True, help='Pre-build thumbnails')
+@click.option('--seed', default=1, show_default=True, help='Random seed')
+@click.option('--manifest', default=os.path.join('bench', 'manifest.json'), show_default=True)
+def seed(submissions, images, days, chunk_size, renditions, seed, manifest):
+    """Create synthetic submissions, photos and prices"""
+    if Image is None:
+        raise click.ClickException('Pillow is required to generate images')
+    
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    
+    with app.app_context():
+        init_database()
+        
+        blobs = seed_images(rng, images, renditions)
+        click.echo(f"Wrote {len(blobs)} images ({sum(size for _, _, size in blobs) / 1024 / 1024:.1f} MB)")
+        
+        now = datetime.utcnow().replace(microsecond=0)
+        created = 0
+        while created < submissions:
+            batch = min(chunk_size, submissions - created)
+            persist_submissions([
+                synthetic_payload(rng, blobs, now - timedelta(seconds=rng.randint(0, days * 86400)))
+                for _ in range(batch)
+            ])
+            created += batch
+            click.echo(f"Inserted {created}/{submissions} submissions")
+        
+        price_rows = [
+            {
+                'category': category,
+                'subcategory': subcategory,
+                'price': round(rng.uniform(5, 900), 2),
+                'unit': 'kg'
+            }
+            for category, subcategories in PRICE_CATEGORIES.items()
+            for subcategory in subcategories
+        ]
+        upsert_prices(price_rows)
+        db.session.commit()
+        price_cache.invalidate()
+        
+        max_id = db.session.execute(db.text('SELECT MAX(id) FROM submission')).scalar() or 0
+    
+    with open(manifest, 'w') as manifest_file:
+        json.dump({
+            'seed': seed,
+            'submissions': submissions,
+            'max_submission_id': max_id,
+            'materials': MATERIALS,
+            'search_terms': sorted({item.split()[-1] for items in ITEMS.values() for item in items} | set(CITIES)),
+            'photos': [filename for _, filename, _ in blobs],
+            'renditions': list(app.config['IMAGE_RENDITIONS']) if renditions else [],
+            'rendition_extension': RENDITION_EXTENSION,
+            'upload_samples': [filename for _, filename, size in sorted(blobs, key=lambda blob: blob[2])[:3]],
+        }, manifest_file, indent=2)
+    
+    click.echo(f"✅ Seeded {submissions} submissions in {time.perf_counter() - started:.1f}s; manifest at {manifest}")
+
+if __name__ == '__main__':
+    seed()
@@ -0,0 +1,61 @@
+# Gunicorn settings, picked up automatically from the working directory
+#
+# Two profiles, chosen with GUNICORN_WORKER_CLASS:
+#
+#   sync (default) - one request per process, 2 * CPUs + 1 processes.
+#   gevent - a few workers, each serving many requests concurrently as
+#       greenlets. Requests waiting on the remote database, slow uploads or
+#       large image downloads no longer tie up a whole process. psycopg2 is
+#       made cooperative with psycogreen; image resizing, file deletes and
+#       the SQLite ingest queue run on real OS threads. Raise DB_POOL_SIZE /
+#       DB_MAX_OVERFLOW along with GUNICORN_WORKER_CONNECTIONS. The admin
+#       change feed (/admin/events) only streams in this profile.
+#
+# WEB_CONCURRENCY overrides the worker count in either profile.
+
+import multiprocessing
+import os
+
+_cpus = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'sync')
+
+if worker_class == 'gevent':
+    workers = int(os.environ.get('WEB_CONCURRENCY', _cpus))
+    worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 200))
+    # Workers must import the app after gevent has patched the standard library
+    preload_app = False
+else:
+    workers = int(os.environ.get('WEB_CONCURRENCY', _cpus * 2 + 1))
+    preload_app = True
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))  # large uploads on slow links
+graceful_timeout = 30
+keepalive = 5  # seconds; behind a proxy that keeps connections open
+
+# Recycle workers now and then to bound memory growth from fragmentation
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = max_requests // 10
+
+accesslog = None  # request logging is done by the app
+errorlog = '-'
+
+def post_fork(server, worker):
+    """Give each worker its own database connections.
+
+    With preload_app the engine is created in the master; its pooled
+    connections must not be shared by the forked workers. Under gevent the
+    psycopg2 wait callback is installed so queries yield to other greenlets.
+    """
+    import sys
+    
+    if worker_class == 'gevent':
+        try:
+            from psycogreen.gevent import patch_psycopg
+            patch_psycopg()
+        except ImportError:
+            server.log.warning("psycogreen is not installed; database calls will block the gevent worker")
+    
+    if 'app' in sys.modules:
+        sys.modules['app'].dispose_inherited_engine()